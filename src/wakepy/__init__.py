@@ -1,4 +1,3 @@
-# NOTE The methods sub-package is imported for registering all the methods.
 from __future__ import annotations
 
 import typing
@@ -6,8 +5,6 @@ import typing
 if typing.TYPE_CHECKING:
     from typing import Type
 
-from . import methods as methods
-
 try:
     from ._version import __version__ as __version__
     from ._version import version_tuple as version_tuple
@@ -33,6 +30,10 @@ JeepneyDBusAdapter: Type[DBusAdapter]
 support DBus, but it's nice to be able to import this directly from wakepy
 top level package."""
 
+# NOTE: The methods sub-package is not imported here. It is imported (and all
+# the Methods registered) on the first method registry lookup. See:
+# wakepy.core.registry
+
 
 def __getattr__(name: str) -> object:
     """Some lazy implementation of lazy loading.
@@ -43,4 +44,10 @@ def __getattr__(name: str) -> object:
         from wakepy.dbus_adapters.jeepney import JeepneyDBusAdapter
 
         return JeepneyDBusAdapter  # pragma: no-cover-if-no-dbus
+    elif name == "methods":
+        # Not "from wakepy import methods", as that would call this function
+        # again before importing the sub-package.
+        import wakepy.methods as methods
+
+        return methods
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -12,6 +12,7 @@ or using the executable
 from __future__ import annotations
 
 import argparse
+import io
 import itertools
 import platform
 import sys
@@ -19,7 +20,7 @@ import time
 import typing
 from textwrap import dedent, fill
 
-from wakepy import ModeExit
+from wakepy import ModeExit, __version__
 from wakepy.core.constants import ModeName
 from wakepy.core.mode import Mode
 from wakepy.core.platform import CURRENT_PLATFORM, get_platform_debug_info, is_windows
@@ -38,13 +39,31 @@ WAKEPY_TEXT_TEMPLATE = r"""                  _
 {VERSION_STRING}| |      __/ |
                             |_|     |___/ """
 
+SPINNER_SYMBOLS = ("⢎⡰", "⢎⡡", "⢎⡑", "⢎⠱", "⠎⡱", "⢊⡱", "⢌⡱", "⢆⡱")
+ASCII_SPINNER_SYMBOLS = ("|", "/", "-", "\\")
+
 WAKEPY_TICKBOXES_TEMPLATE = """
  [{no_auto_suspend}] System will continue running programs
  [{presentation_mode}] Display is kept on and automatic screenlock disabled.
 """
 
+_MODE_BY_FLAGS = {
+    # The default action, if nothing is selected, is "keep running"
+    (False, False): ModeName.KEEP_RUNNING,
+    (True, False): ModeName.KEEP_RUNNING,
+    (False, True): ModeName.KEEP_PRESENTING,
+}
+"""The selected mode for each (keep_running, keep_presenting) combination of
+the command line flags. Selecting both is not allowed."""
+
 
 def main() -> None:
+    if isinstance(sys.stdout, io.TextIOWrapper):
+        # Show the output right away also when stdout is redirected (for
+        # example, piped to tee); otherwise it would be block-buffered and
+        # shown only on exit.
+        sys.stdout.reconfigure(line_buffering=True)
+
     mode_name, deprecations = parse_arguments(sys.argv[1:])
     mode = Mode.from_name(mode_name, on_fail=handle_activation_error)
     print(get_startup_text(mode=mode_name))
@@ -70,8 +89,6 @@ def handle_activation_error(result: ActivationResult) -> None:
 def _get_activation_error_text(result: ActivationResult) -> str:
     import textwrap
 
-    from wakepy import __version__
-
     error_text = f"""
     Wakepy could not activate the "{result.mode_name}" mode. This might occur because of a bug or because your current platform is not yet supported or your system is missing required software.
 
@@ -118,18 +135,10 @@ def parse_arguments(
     keep_running = args.keep_running or args.k
     keep_presenting = args.keep_presenting or args.presentation
 
-    n_flags_selected = sum((keep_running, keep_presenting))
-
-    if n_flags_selected > 1:
+    mode = _MODE_BY_FLAGS.get((keep_running, keep_presenting))
+    if mode is None:
         raise ValueError('You may only select one of the modes! See: "wakepy -h"')
 
-    if keep_running or n_flags_selected == 0:
-        # The default action, if nothing is selected, is "keep running"
-        mode = ModeName.KEEP_RUNNING
-    else:
-        assert keep_presenting
-        mode = ModeName.KEEP_PRESENTING
-
     return mode, deprecations
 
 
@@ -188,8 +197,6 @@ def _get_argparser() -> argparse.ArgumentParser:
 
 
 def get_startup_text(mode: ModeName) -> str:
-    from wakepy import __version__
-
     wakepy_text = WAKEPY_TEXT_TEMPLATE.format(
         VERSION_STRING=f"{'  v.'+__version__[:24]: <28}"
     )
@@ -201,16 +208,36 @@ def get_startup_text(mode: ModeName) -> str:
 
 
 def wait_until_keyboardinterrupt() -> None:
-    spinner_symbols = get_spinner_symbols()
     try:
-        for spinner_symbol in itertools.cycle(spinner_symbols):  # pragma: no branch
-            print("\r " + spinner_symbol + r" [Press Ctrl+C to exit] ", end="")
-            time.sleep(0.8)
+        if sys.stdout is not None and sys.stdout.isatty():
+            _show_spinner()
+        else:
+            # The spinner is not shown if the output is redirected to a file
+            # or a pipe, or if there is no stdout at all (pythonw). Only show
+            # the hint once and wait, waking up rarely.
+            if sys.stdout is not None:
+                print("[Press Ctrl+C to exit]")
+            while True:  # pragma: no branch
+                time.sleep(3600)
     except KeyboardInterrupt:
         pass
 
 
-def get_spinner_symbols() -> list[str]:
+def _show_spinner() -> None:
+    """Shows the spinner until interrupted (never returns)."""
+    # The spinner frames are rendered only once, and written directly to
+    # stdout instead of calling print() on every tick.
+    frames = [
+        "\r " + spinner_symbol + r" [Press Ctrl+C to exit] "
+        for spinner_symbol in get_spinner_symbols()
+    ]
+    write = sys.stdout.write
+    for frame in itertools.cycle(frames):  # pragma: no branch
+        write(frame)
+        time.sleep(0.8)
+
+
+def get_spinner_symbols() -> Tuple[str, ...]:
 
     if (
         is_windows(CURRENT_PLATFORM)
@@ -220,8 +247,8 @@ def get_spinner_symbols() -> list[str]:
         # yet at version 7.3.17. See:
         # https://github.com/pypy/pypy/issues/3890
         # https://github.com/fohrloop/wakepy/issues/274#issuecomment-2363293422
-        return ["|", "/", "-", "\\"]
-    return ["⢎⡰", "⢎⡡", "⢎⡑", "⢎⠱", "⠎⡱", "⢊⡱", "⢌⡱", "⢆⡱"]
+        return ASCII_SPINNER_SYMBOLS
+    return SPINNER_SYMBOLS
 
 
 if __name__ == "__main__":
@@ -17,15 +17,20 @@ if typing.TYPE_CHECKING:
 
 
 def get_current_platform() -> IdentifiedPlatformType:
-    # Ref: https://docs.python.org/3/library/platform.html#platform.system
-    system = platform.system()
-    if system == "Windows":
+    # Uses sys.platform instead of platform.system(), as it is a constant set
+    # at interpreter build time, and platform.system() needs to call uname().
+    # Ref: https://docs.python.org/3/library/sys.html#sys.platform
+    # (Read into a variable so that mypy does not treat the other branches as
+    # unreachable)
+    system = sys.platform
+    if system == "win32":
         return IdentifiedPlatformType.WINDOWS
-    elif system == "Darwin":
+    elif system == "darwin":
         return IdentifiedPlatformType.MACOS
-    elif system == "Linux":
+    elif system.startswith("linux"):
         return IdentifiedPlatformType.LINUX
-    elif system == "FreeBSD":
+    elif system.startswith("freebsd"):
+        # The major version is part of sys.platform, e.g. "freebsd14"
         return IdentifiedPlatformType.FREEBSD
 
     warnings.warn(
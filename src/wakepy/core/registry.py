@@ -38,7 +38,9 @@ the name of the Method and optionally the name of the Mode the Method
 implements.
 
 Updated automatically; when python loads a module with a subclass of Method,
-the Method class is added to this registry.
+the Method class is added to this registry. The Methods shipped with wakepy
+are registered on the first lookup, or before registering any other Method;
+see _register_wakepy_methods.
 
 Data structure: The keys are names of Modes and values are MethodDicts. In
 MethodDict, keys are names of methods, and values are Method classes.
@@ -61,6 +63,12 @@ def register_method(method_class: Type[Method]) -> None:
         )
         return
 
+    module = method_class.__module__
+    if not (module == "wakepy.methods" or module.startswith("wakepy.methods.")):
+        # The Methods shipped with wakepy are always registered first, so that
+        # a name collision is raised when defining the custom Method.
+        _register_wakepy_methods()
+
     logger.debug("Registering Method %s (name: %s)", method_class, method_class.name)
 
     method_dict: MethodDict = _method_registry.get(method_class.mode_name, dict())
@@ -83,6 +91,15 @@ def register_method(method_class: Type[Method]) -> None:
     _method_registry.setdefault(method_class.mode_name, method_dict)
 
 
+def _register_wakepy_methods() -> None:
+    """Registers the Methods shipped with wakepy by importing the
+    wakepy.methods sub-package. This is done lazily, on the first registry
+    lookup or when registering a Method defined outside of wakepy.methods, so
+    that importing wakepy does not import every method module. Subsequent
+    calls are cheap, as the module is then found from sys.modules."""
+    import wakepy.methods  # noqa: F401
+
+
 def get_method(
     method_name: str, mode_name: Optional[ModeNameValue | str] = None
 ) -> MethodCls:
@@ -109,6 +126,8 @@ def get_method(
 
     """
 
+    _register_wakepy_methods()
+
     notfound = ValueError(
         f'No Method with name "{method_name}" found!'
         " Check that the name is correctly spelled and that the module containing"
@@ -206,4 +225,5 @@ def get_methods_for_mode(
     methods: list[MethodCls]
         The Method classes for the Mode.
     """
+    _register_wakepy_methods()
     return [m for m in _method_registry.get(mode_name, dict()).values()]
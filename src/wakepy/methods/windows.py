@@ -59,13 +59,21 @@ class WindowsSetThreadExecutionState(Method, ABC):
             args=(self.flags, self._release, self._queue_from_thread),
         )
         self._inhibiting_thread.start()
-        self._check_thread_response()
+        try:
+            self._check_thread_response()
+        except Exception:
+            # The exit_mode() is not called if entering the mode fails. Let the
+            # inhibiting thread finish instead of waiting for a release.
+            self._release.set()
+            raise
 
     def exit_mode(self) -> None:
+        if self._inhibiting_thread is None:
+            # The mode was never entered; there is no thread to release.
+            return
         self._release.set()
         self._check_thread_response()
-        if self._inhibiting_thread:
-            self._inhibiting_thread.join(timeout=self._wait_timeout)
+        self._inhibiting_thread.join(timeout=self._wait_timeout)
         self._inhibiting_thread = None
 
     def _check_thread_response(self) -> None:
@@ -89,17 +97,11 @@ def _inhibit_until_released(
     flags: Flags, exit_event: Event, queue: Queue[int | Exception]
 ) -> None:
     _call_and_put_result_in_queue(flags.value, queue)
-    exit_event.wait(_release_event_timeout)
+    # Blocks until the exit_event is set (in exit_mode, or if enter_mode fails)
+    exit_event.wait()
     _call_and_put_result_in_queue(Flags.RELEASE.value, queue)
 
 
-_release_event_timeout: int | float | None = None
-"""Timeout for the release events (to stop a inhibit thread). None means
-wait indefinitely. This variable exists for tests (edit this to make tests not
-to wait forever in case of errors).
-"""
-
-
 def _call_and_put_result_in_queue(flags: int, queue: Queue[int | Exception]) -> None:
     try:
         prev_flags = _call_set_thread_execution_state(flags)
@@ -108,6 +110,35 @@ def _call_and_put_result_in_queue(flags: int, queue: Queue[int | Exception]) ->
         queue.put(exc)
 
 
+_set_thread_execution_state: typing.Callable[[int], int] | None = None
+"""The SetThreadExecutionState function of kernel32.dll. Created on first use
+by _get_set_thread_execution_state()."""
+
+
+def _get_set_thread_execution_state() -> typing.Callable[[int], int]:
+    """Get the SetThreadExecutionState function. The function prototype is
+    created only once and then reused in the later calls.
+
+    Raises
+    ------
+    AttributeError:
+        If the kernel32.dll is not available (not on Windows).
+    """
+    global _set_thread_execution_state
+
+    if _set_thread_execution_state is None:
+        # The return type and the argument type are unsigned 32-bit integers.
+        # Otherwise the return value would be a signed 32-bit integer which is
+        # overflown. So for example instead of returning 2147483649 it would
+        # return -2147483647.
+        prototype = ctypes.WINFUNCTYPE(ctypes.c_uint32, ctypes.c_uint32)  # type: ignore[attr-defined,unused-ignore]
+        _set_thread_execution_state = typing.cast(
+            typing.Callable[[int], int],
+            prototype(("SetThreadExecutionState", ctypes.windll.kernel32)),  # type: ignore[attr-defined,unused-ignore]
+        )
+    return _set_thread_execution_state
+
+
 def _call_set_thread_execution_state(flags: int) -> int:
     """Call the SetThreadExecutionState with the given flags.
 
@@ -130,23 +161,20 @@ def _call_set_thread_execution_state(flags: int) -> int:
         returns NULL (0), indicating an error.
     """
     try:
-        # This sets the return type to be unsigned 32-bit integer. Otherwise it
-        # will be a signed 32-bit integer which is overflown. So for example
-        # instead of returning 2147483649 it would return -2147483647.
-        ctypes.windll.kernel32.SetThreadExecutionState.restype = ctypes.c_uint32  # type: ignore[attr-defined,unused-ignore]
+        set_thread_execution_state = _get_set_thread_execution_state()
         logger.debug(
             "Calling SetThreadExecutionState with flags: %s (%s)", flags, Flags(flags)
         )
         # The return value will be 0 in case of error, and the value of the
         # previous thread execution state otherwise.
-        retval = ctypes.windll.kernel32.SetThreadExecutionState(flags)  # type: ignore[attr-defined,unused-ignore]
+        retval = set_thread_execution_state(flags)
     except AttributeError as exc:
         raise RuntimeError("Could not use kernel32.dll!") from exc
 
     if retval == 0:
         raise RuntimeError("SetThreadExecutionState returned NULL")
 
-    return typing.cast(int, retval)
+    return retval
 
 
 class WindowsKeepRunning(WindowsSetThreadExecutionState):
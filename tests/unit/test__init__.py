@@ -1,3 +1,4 @@
+import subprocess
 import sys
 
 import pytest
@@ -34,3 +35,24 @@ def test_failing_import():
 
     with pytest.raises(AttributeError):
         wakepy.something_that_does_not_exist
+
+
+def test_methods_is_lazily_loaded():
+    # Run in a separate process as wakepy.methods is already imported here.
+    # Accessing the attribute goes through the module __getattr__.
+    code = (
+        "import sys, wakepy; " "print(wakepy.methods is sys.modules['wakepy.methods'])"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], stdout=subprocess.PIPE, check=True
+    )
+    assert result.stdout.decode().strip() == "True"
+
+
+def test_import_does_not_import_methods():
+    # Run in a separate process as wakepy.methods is already imported here.
+    code = "import sys, wakepy; print('wakepy.methods' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], stdout=subprocess.PIPE, check=True
+    )
+    assert result.stdout.decode().strip() == "False"
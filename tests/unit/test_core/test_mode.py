@@ -28,13 +28,6 @@ if typing.TYPE_CHECKING:
     from typing import List, Type
 
 
-@pytest.fixture
-def dbus_adapter_cls():
-    class TestDbusAdapter(DBusAdapter): ...
-
-    return TestDbusAdapter
-
-
 @pytest.fixture
 def testmode_cls():
     class TestMode(Mode): ...
@@ -95,12 +88,12 @@ def mode1_with_dbus(
     methods_abc: List[Type[Method]],
     testmode_cls: Type[Mode],
     methods_priority0: List[str],
-    dbus_adapter_cls: Type[DBusAdapter],
+    fake_dbus_adapter: Type[DBusAdapter],
 ):
     return testmode_cls(
         methods_abc,
         methods_priority=methods_priority0,
-        dbus_adapter=dbus_adapter_cls,
+        dbus_adapter=fake_dbus_adapter,
         name="TestMode1",
     )
 
@@ -19,23 +19,23 @@ P = IdentifiedPlatformType
 
 class TestGetCurrentPlatform:
 
-    @patch("platform.system", lambda: "Windows")
+    @patch("sys.platform", "win32")
     def test_windows(self):
         assert get_current_platform() == PlatformType.WINDOWS
 
-    @patch("platform.system", lambda: "Darwin")
+    @patch("sys.platform", "darwin")
     def test_macos(self):
         assert get_current_platform() == PlatformType.MACOS
 
-    @patch("platform.system", lambda: "Linux")
+    @patch("sys.platform", "linux")
     def test_linux(self):
         assert get_current_platform() == PlatformType.LINUX
 
-    @patch("platform.system", lambda: "FreeBSD")
+    @patch("sys.platform", "freebsd14")
     def test_bsd(self):
         assert get_current_platform() == PlatformType.FREEBSD
 
-    @patch("platform.system", lambda: "This does not exist")
+    @patch("sys.platform", "this-does-not-exist")
     def test_other(self):
         with pytest.warns(UserWarning, match="Could not detect current platform!"):
             assert get_current_platform() == PlatformType.UNKNOWN
@@ -1,4 +1,8 @@
 import re
+import subprocess
+import sys
+import textwrap
+from unittest.mock import Mock
 
 import pytest
 
@@ -129,3 +133,53 @@ def test_register_method():
         ),
     ):
         get_method("A")
+
+
+def test_custom_method_with_same_name_as_wakepy_method():
+    # Run in a separate process, as the Methods shipped with wakepy are
+    # already registered here. The custom Method must fail when it is defined,
+    # and the wakepy Methods must still be usable afterwards.
+    code = textwrap.dedent(
+        """
+        from wakepy import Method
+        from wakepy.core.registry import MethodRegistryError, get_method
+
+        try:
+            class MyCaffeinate(Method):
+                name = "caffeinate"
+                mode_name = "keep.running"
+        except MethodRegistryError as exc:
+            print(exc)
+        print(get_method("caffeinate", "keep.running").__qualname__)
+        """
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], stdout=subprocess.PIPE, check=True
+    )
+    assert result.stdout.decode().splitlines() == [
+        'Duplicate Method name "caffeinate": MyCaffeinate (already registered '
+        "to CaffeinateKeepRunning)",
+        "CaffeinateKeepRunning",
+    ]
+
+
+@pytest.mark.parametrize(
+    "module, registers_wakepy_methods",
+    [
+        ("wakepy.methods", False),
+        ("wakepy.methods.windows", False),
+        ("wakepy.methods_extra", True),
+        ("mypackage.methods", True),
+    ],
+)
+@pytest.mark.usefixtures("empty_method_registry")
+def test_register_method_registers_wakepy_methods_first(
+    module, registers_wakepy_methods, monkeypatch
+):
+    register_wakepy_methods = Mock()
+    monkeypatch.setattr(
+        "wakepy.core.registry._register_wakepy_methods", register_wakepy_methods
+    )
+    type("SomeMethod", (Method,), dict(name="some", mode_name="foo", __module__=module))
+
+    assert register_wakepy_methods.called is registers_wakepy_methods
@@ -1,7 +1,10 @@
 """Unit tests for the __main__ module"""
 
+import io
 import sys
-from unittest.mock import Mock, call, patch
+from types import SimpleNamespace
+from typing import List, Optional, Tuple
+from unittest.mock import Mock, call
 
 import pytest
 
@@ -19,17 +22,19 @@ from wakepy.core import PlatformType
 from wakepy.core.constants import IdentifiedPlatformType, ModeName
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mode_name_working():
     return "testmode_working"
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mode_name_broken():
     return "testmode_broken"
 
 
-@pytest.fixture
+# The Method classes are registered when defined, so they are created only once
+# per module. They are used only read-only in the tests.
+@pytest.fixture(scope="module")
 def method1(mode_name_working):
     class WorkingMethod(Method):
         """This is a successful method as it implements enter_mode which
@@ -45,7 +50,7 @@ def method1(mode_name_working):
     return WorkingMethod
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def method2_broken(mode_name_broken):
     class BrokenMethod(Method):
         """This is a unsuccessful method as it implements enter_mode which
@@ -61,39 +66,37 @@ def method2_broken(mode_name_broken):
     return BrokenMethod
 
 
-@pytest.mark.parametrize(
-    "args",
-    [
-        ["-r"],
-        ["--keep-running"],
-        # Also no args means keep running
-        [],
-    ],
+_KEEP_RUNNING_ARGS = (
+    ("-r",),
+    ("--keep-running",),
+    # Also no args means keep running
+    (),
+)
+
+_KEEP_PRESENTING_ARGS = (
+    ("-p",),
+    ("--keep-presenting",),
 )
+
+_TOO_MANY_MODES_ARGS = (
+    ("-r", "-p"),
+    ("--keep-presenting", "-r"),
+    ("-p", "--keep-running"),
+    ("--keep-presenting", "--keep-running"),
+)
+
+
+@pytest.mark.parametrize("args", _KEEP_RUNNING_ARGS)
 def test_get_argparser_keep_running(args):
     assert parse_arguments(args) == (ModeName.KEEP_RUNNING, [])
 
 
-@pytest.mark.parametrize(
-    "args",
-    [
-        ["-p"],
-        ["--keep-presenting"],
-    ],
-)
+@pytest.mark.parametrize("args", _KEEP_PRESENTING_ARGS)
 def test_get_argparser_keep_presenting(args):
     assert parse_arguments(args) == (ModeName.KEEP_PRESENTING, [])
 
 
-@pytest.mark.parametrize(
-    "args",
-    [
-        ["-r", "-p"],
-        ["--keep-presenting", "-r"],
-        ["-p", "--keep-running"],
-        ["--keep-presenting", "--keep-running"],
-    ],
-)
+@pytest.mark.parametrize("args", _TOO_MANY_MODES_ARGS)
 def test_get_argparser_too_many_modes(args):
     with pytest.raises(ValueError, match="You may only select one of the modes!"):
         assert parse_arguments(args)
@@ -117,112 +120,122 @@ def test_get_startup_text_smoke_test():
     assert isinstance(get_startup_text(ModeName.KEEP_PRESENTING), str)
 
 
-def test_wait_until_keyboardinterrupt():
+@pytest.mark.parametrize("isatty", [True, False, None])
+def test_wait_until_keyboardinterrupt(isatty, monkeypatch, capsys):
+    # isatty=None means that there is no stdout at all (sys.stdout is None),
+    # like when running with pythonw on Windows.
     def raise_keyboardinterrupt(_):
         raise KeyboardInterrupt
 
-    with patch("wakepy.__main__.time") as timemock:
-        timemock.sleep.side_effect = raise_keyboardinterrupt
-
-        wait_until_keyboardinterrupt()
+    # Replace only the reference to the time module in wakepy.__main__; other
+    # threads (like the ones in integration tests) use the real time.sleep.
+    monkeypatch.setattr(
+        "wakepy.__main__.time", SimpleNamespace(sleep=raise_keyboardinterrupt)
+    )
+    if isatty is None:
+        monkeypatch.setattr("sys.stdout", None)
+    else:
+        monkeypatch.setattr("sys.stdout.isatty", lambda: isatty)
+    wait_until_keyboardinterrupt()
+
+    printed_text = capsys.readouterr().out
+    if isatty:
+        # The first spinner frame was written before the KeyboardInterrupt
+        assert printed_text.endswith(" [Press Ctrl+C to exit] ")
+    elif isatty is False:
+        # No spinner when the output is redirected; only the hint.
+        assert printed_text == "[Press Ctrl+C to exit]\n"
+    else:
+        assert printed_text == ""
 
 
-@patch("builtins.print")
-def test_handle_activation_error(print_mock):
+def test_handle_activation_error(capsys):
     result = ActivationResult()
     handle_activation_error(result)
-    if sys.version_info[:2] == (3, 7):
-        # on python 3.7, need to do other way.
-        printed_text = print_mock.mock_calls[0][1][0]
-    else:
-        printed_text = "\n".join(print_mock.mock_calls[0].args)
+    printed_text = capsys.readouterr().out
     # Some sensible text was printed to the user
     assert "Wakepy could not activate" in printed_text
 
 
-@patch("wakepy.__main__.wait_until_keyboardinterrupt")
-@patch("wakepy.__main__.parse_arguments")
 class TestMain:
     """Tests the main() function from the __main__.py in a simple way. This
     is more of a smoke test. The functionality of the different parts is
     already tested in other unit tests."""
 
-    def test_working_mode(
-        self,
-        parse_arguments,
-        wait_until_keyboardinterrupt,
-        method1,
-    ):
+    @pytest.fixture(autouse=True)
+    def setup_mock_manager(self, monkeypatch):
+        # Records the calls to print() and wait_until_keyboardinterrupt() in
+        # the order they were made.
+        self.manager = Mock()
+        # Assume that user has specified some mode in the commandline. The
+        # tests set this to resolve to `method.mode_name`.
+        self.parse_arguments_retval: Tuple[Optional[str], List[str]] = (None, [])
 
-        with patch("sys.argv", self.sys_argv), patch("builtins.print") as print_mock:
-            manager = self.setup_mock_manager(
-                method1, print_mock, parse_arguments, wait_until_keyboardinterrupt
-            )
-            main()
+        # The patched value for sys.argv. Does not matter here otherwise, but
+        # should be a list of at least two items.
+        monkeypatch.setattr("sys.argv", ["", ""])
+        # main() reconfigures sys.stdout, so use a separate one in the tests.
+        monkeypatch.setattr("sys.stdout", io.TextIOWrapper(io.BytesIO()))
+        monkeypatch.setattr("builtins.print", self.manager.print)
+        monkeypatch.setattr(
+            "wakepy.__main__.wait_until_keyboardinterrupt",
+            self.manager.wait_until_keyboardinterrupt,
+        )
+        # A plain function is enough here as only the return value matters.
+        monkeypatch.setattr(
+            "wakepy.__main__.parse_arguments", lambda _: self.parse_arguments_retval
+        )
 
-        assert manager.mock_calls == [
+    def test_working_mode(self, method1):
+        self.parse_arguments_retval = method1.mode_name, []
+        main()
+
+        assert self.manager.mock_calls == [
             call.print(get_startup_text(method1.mode_name)),
             call.wait_until_keyboardinterrupt(),
             call.print("\n\nExited."),
         ]
+        assert sys.stdout.line_buffering is True
+
+    def test_stdout_not_a_textiowrapper(self, method1, monkeypatch):
+        # For example, if sys.stdout is replaced with a StringIO, it is left
+        # as is.
+        stream = io.StringIO()
+        monkeypatch.setattr("sys.stdout", stream)
+        self.parse_arguments_retval = method1.mode_name, []
+        main()
 
-    @pytest.mark.usefixtures("method2_broken")
-    def test_non_working_mode(
-        self,
-        parse_arguments,
-        wait_until_keyboardinterrupt,
-        method2_broken,
-        monkeypatch,
-    ):
+        assert sys.stdout is stream
+        assert stream.line_buffering is False
+        assert call.wait_until_keyboardinterrupt() in self.manager.mock_calls
+
+    def test_non_working_mode(self, method2_broken, monkeypatch):
         # need to turn off WAKEPY_FAKE_SUCCESS as we want to get a failure.
         monkeypatch.setenv("WAKEPY_FAKE_SUCCESS", "0")
-
-        with patch("sys.argv", self.sys_argv), patch("builtins.print") as print_mock:
-            manager = self.setup_mock_manager(
-                method2_broken,
-                print_mock,
-                parse_arguments,
-                wait_until_keyboardinterrupt,
-            )
-            main()
+        self.parse_arguments_retval = method2_broken.mode_name, []
+        main()
 
         expected_result = ActivationResult(
             results=[], mode_name=method2_broken.mode_name
         )
-        assert manager.mock_calls == [
+        assert self.manager.mock_calls == [
             call.print(get_startup_text(method2_broken.mode_name)),
             call.print(_get_activation_error_text(expected_result)),
         ]
 
-    @staticmethod
-    def setup_mock_manager(
-        method: Method,
-        print_mock,
-        parse_arguments,
-        wait_until_keyboardinterrupt,
-    ):
-        # Assume that user has specified some mode in the commandline which
-        # resolves to `method.mode_name`
-        parse_arguments.return_value = method.mode_name, []
-
-        mocks = Mock()
-        mocks.attach_mock(print_mock, "print")
-        mocks.attach_mock(wait_until_keyboardinterrupt, "wait_until_keyboardinterrupt")
-        return mocks
-
-    @property
-    def sys_argv(self):
-        # The patched value for sys.argv. Does not matter here otherwise, but
-        # should be a list of at least two items.
-        return ["", ""]
-
 
 class TestGetSpinnerSymbols:
-    @patch("wakepy.__main__.CURRENT_PLATFORM", IdentifiedPlatformType.LINUX)
-    def test_on_linux(self):
-        assert get_spinner_symbols() == ["⢎⡰", "⢎⡡", "⢎⡑", "⢎⠱", "⠎⡱", "⢊⡱", "⢌⡱", "⢆⡱"]
-
-    @patch("wakepy.__main__.CURRENT_PLATFORM", IdentifiedPlatformType.WINDOWS)
-    @patch("wakepy.__main__.platform.python_implementation", lambda: "PyPy")
-    def test_on_windows_pypy(self):
-        assert get_spinner_symbols() == ["|", "/", "-", "\\"]
+    def test_on_linux(self, monkeypatch):
+        monkeypatch.setattr(
+            "wakepy.__main__.CURRENT_PLATFORM", IdentifiedPlatformType.LINUX
+        )
+        assert get_spinner_symbols() == ("⢎⡰", "⢎⡡", "⢎⡑", "⢎⠱", "⠎⡱", "⢊⡱", "⢌⡱", "⢆⡱")
+
+    def test_on_windows_pypy(self, monkeypatch):
+        monkeypatch.setattr(
+            "wakepy.__main__.CURRENT_PLATFORM", IdentifiedPlatformType.WINDOWS
+        )
+        monkeypatch.setattr(
+            "wakepy.__main__.platform.python_implementation", lambda: "PyPy"
+        )
+        assert get_spinner_symbols() == ("|", "/", "-", "\\")
@@ -0,0 +1,57 @@
+import pytest
+
+from wakepy.core.dbus import BusType, DBusAdapter, DBusAddress
+
+
+class FakeDBusAdapter(DBusAdapter):
+    """A fake dbus adapter which processes the calls with the function given
+    in the __init__"""
+
+    def __init__(self, process):
+        super().__init__()
+        self._process = process
+
+    def process(self, call):
+        return self._process(call)
+
+
+@pytest.fixture(scope="session")
+def dbus_adapter_factory():
+    """Creates fake dbus adapters. Usage: dbus_adapter_factory(process), where
+    process is a function taking a DBusMethodCall."""
+    return FakeDBusAdapter
+
+
+@pytest.fixture(scope="session")
+def screen_saver():
+    return DBusAddress(
+        bus=BusType.SESSION,
+        service="org.freedesktop.ScreenSaver",
+        path="/org/freedesktop/ScreenSaver",
+        interface="org.freedesktop.ScreenSaver",
+    )
+
+
+@pytest.fixture(scope="session")
+def power_management():
+    return DBusAddress(
+        bus=BusType.SESSION,
+        service="org.freedesktop.PowerManagement",
+        path="/org/freedesktop/PowerManagement/Inhibit",
+        interface="org.freedesktop.PowerManagement.Inhibit",
+    )
+
+
+@pytest.fixture(scope="session")
+def session_manager():
+    return DBusAddress(
+        bus=BusType.SESSION,
+        service="org.gnome.SessionManager",
+        path="/org/gnome/SessionManager",
+        interface="org.gnome.SessionManager",
+    )
+
+
+@pytest.fixture(scope="session")
+def fake_cookie():
+    return 75848243423
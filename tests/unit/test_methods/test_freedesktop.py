@@ -10,7 +10,7 @@ from unittest.mock import patch
 
 import pytest
 
-from wakepy.core.dbus import BusType, DBusAdapter, DBusAddress, DBusMethod
+from wakepy.core.dbus import DBusAdapter, DBusAddress, DBusMethod
 from wakepy.methods.freedesktop import (
     FreedesktopPowerManagementInhibit,
     FreedesktopScreenSaverInhibit,
@@ -18,42 +18,25 @@ from wakepy.methods.freedesktop import (
     _get_kde_plasma_version,
 )
 
-screen_saver = DBusAddress(
-    bus=BusType.SESSION,
-    service="org.freedesktop.ScreenSaver",
-    path="/org/freedesktop/ScreenSaver",
-    interface="org.freedesktop.ScreenSaver",
-)
-
-power_management = DBusAddress(
-    bus=BusType.SESSION,
-    service="org.freedesktop.PowerManagement",
-    path="/org/freedesktop/PowerManagement/Inhibit",
-    interface="org.freedesktop.PowerManagement.Inhibit",
-)
-
-fake_cookie = 75848243423
-
-
-def get_test_dbus_adapter(process) -> DBusAdapter:
-    class TestAdapter(DBusAdapter):
-
-        def process(self, call):
-            return process(call)
-
-    return TestAdapter()
-
 
 class TestFreedesktopEnterMode:
 
     @pytest.mark.parametrize(
-        "method_cls, dbus_address",
+        "method_cls, dbus_address_fixture",
         [
-            (FreedesktopScreenSaverInhibit, screen_saver),
-            (FreedesktopPowerManagementInhibit, power_management),
+            (FreedesktopScreenSaverInhibit, "screen_saver"),
+            (FreedesktopPowerManagementInhibit, "power_management"),
         ],
     )
-    def test_success(self, method_cls, dbus_address: DBusAddress):
+    def test_success(
+        self,
+        method_cls,
+        dbus_address_fixture,
+        fake_cookie,
+        request,
+        dbus_adapter_factory,
+    ):
+        dbus_address: DBusAddress = request.getfixturevalue(dbus_address_fixture)
 
         method_inhibit = DBusMethod(
             name="Inhibit",
@@ -72,7 +55,7 @@ class TestFreedesktopEnterMode:
 
             return (fake_cookie,)
 
-        method = method_cls(dbus_adapter=get_test_dbus_adapter(process))
+        method = method_cls(dbus_adapter=dbus_adapter_factory(process))
         # At the start, there is no inhibit cookie.
         assert method.inhibit_cookie is None
 
@@ -89,12 +72,14 @@ class TestFreedesktopEnterMode:
         "method_cls",
         [FreedesktopScreenSaverInhibit, FreedesktopPowerManagementInhibit],
     )
-    def test_with_dbus_adapter_which_returns_none(self, method_cls):
+    def test_with_dbus_adapter_which_returns_none(
+        self, method_cls, dbus_adapter_factory
+    ):
 
         def process(_):
             return None
 
-        method = method_cls(dbus_adapter=get_test_dbus_adapter(process))
+        method = method_cls(dbus_adapter=dbus_adapter_factory(process))
 
         with pytest.raises(
             RuntimeError,
@@ -106,14 +91,22 @@ class TestFreedesktopEnterMode:
 class TestFreedesktopExitMode:
 
     @pytest.mark.parametrize(
-        "method_cls, dbus_address",
+        "method_cls, dbus_address_fixture",
         [
-            (FreedesktopScreenSaverInhibit, screen_saver),
-            (FreedesktopPowerManagementInhibit, power_management),
+            (FreedesktopScreenSaverInhibit, "screen_saver"),
+            (FreedesktopPowerManagementInhibit, "power_management"),
         ],
     )
-    def test_successful_exit(self, method_cls, dbus_address: DBusAddress):
+    def test_successful_exit(
+        self,
+        method_cls,
+        dbus_address_fixture,
+        fake_cookie,
+        request,
+        dbus_adapter_factory,
+    ):
         # Arrange
+        dbus_address: DBusAddress = request.getfixturevalue(dbus_address_fixture)
 
         method_uninhibit = DBusMethod(
             name="UnInhibit",
@@ -125,7 +118,7 @@ class TestFreedesktopExitMode:
             assert call.method == method_uninhibit
             assert call.get_kwargs() == {"cookie": fake_cookie}
 
-        method = method_cls(dbus_adapter=get_test_dbus_adapter(process))
+        method = method_cls(dbus_adapter=dbus_adapter_factory(process))
         method.inhibit_cookie = fake_cookie
 
         # Act
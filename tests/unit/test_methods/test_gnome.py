@@ -5,37 +5,43 @@ adapter is used which simply asserts the Call objects and returns what we
 would expect from a dbus service."""
 
 import re
+from types import MappingProxyType
 
 import pytest
 
-from wakepy.core.dbus import BusType, DBusAdapter, DBusAddress, DBusMethod
+from wakepy.core.dbus import DBusMethod
 from wakepy.methods.gnome import (
     GnomeFlag,
     GnomeSessionManagerNoIdle,
     GnomeSessionManagerNoSuspend,
 )
 
-session_manager = DBusAddress(
-    bus=BusType.SESSION,
-    service="org.gnome.SessionManager",
-    path="/org/gnome/SessionManager",
-    interface="org.gnome.SessionManager",
-)
-
-
-fake_cookie = 75848243423
-
-
-@pytest.mark.parametrize(
-    "method_cls, flag",
-    [
-        (GnomeSessionManagerNoSuspend, GnomeFlag.INHIBIT_SUSPEND),
-        (GnomeSessionManagerNoIdle, GnomeFlag.INHIBIT_IDLE),
-    ],
-)
-def test_gnome_enter_mode(method_cls, flag):
-    # Arrange
-    method_inhibit = DBusMethod(
+GNOME_METHODS_AND_FLAGS = [
+    (GnomeSessionManagerNoSuspend, GnomeFlag.INHIBIT_SUSPEND),
+    (GnomeSessionManagerNoIdle, GnomeFlag.INHIBIT_IDLE),
+]
+
+
+def pytest_generate_tests(metafunc):
+    # The parameters are session scoped, so that fixtures depending on them may
+    # be cached for the whole session.
+    ids = [method_cls.__name__ for method_cls, _ in GNOME_METHODS_AND_FLAGS]
+    if "flag" in metafunc.fixturenames:
+        metafunc.parametrize(
+            "method_cls, flag", GNOME_METHODS_AND_FLAGS, ids=ids, scope="session"
+        )
+    elif "method_cls" in metafunc.fixturenames:
+        metafunc.parametrize(
+            "method_cls",
+            [method_cls for method_cls, _ in GNOME_METHODS_AND_FLAGS],
+            ids=ids,
+            scope="session",
+        )
+
+
+@pytest.fixture(scope="session")
+def method_inhibit(session_manager):
+    return DBusMethod(
         name="Inhibit",
         signature="susu",
         params=("app_id", "toplevel_xid", "reason", "flags"),
@@ -43,82 +49,111 @@ def test_gnome_enter_mode(method_cls, flag):
         output_params=("inhibit_cookie",),
     ).of(session_manager)
 
-    class TestAdapter(DBusAdapter):
-        def process(self, call):
-            assert call.method == method_inhibit
-            assert call.get_kwargs() == {
-                "app_id": "wakepy",
-                "toplevel_xid": 42,
-                "reason": "wakelock active",
-                "flags": flag,
-            }
 
+@pytest.fixture(scope="session")
+def method_uninhibit(session_manager):
+    return DBusMethod(
+        name="Uninhibit",
+        signature="u",
+        params=("inhibit_cookie",),
+    ).of(session_manager)
+
+
+@pytest.fixture(scope="session")
+def expected_inhibit_kwargs(flag):
+    return MappingProxyType(
+        {
+            "app_id": "wakepy",
+            "toplevel_xid": 42,
+            "reason": "wakelock active",
+            "flags": flag,
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def expected_uninhibit_kwargs(fake_cookie):
+    return MappingProxyType({"inhibit_cookie": fake_cookie})
+
+
+@pytest.fixture(scope="session")
+def _gnome_method(
+    method_cls,
+    method_inhibit,
+    method_uninhibit,
+    expected_inhibit_kwargs,
+    expected_uninhibit_kwargs,
+    fake_cookie,
+    dbus_adapter_factory,
+):
+    """A GNOME Method instance with a dbus adapter which asserts the Inhibit
+    and Uninhibit calls. Created once per session for each (method_cls, flag).
+    """
+
+    def process(call):
+        if call.method == method_inhibit:
+            assert call.get_kwargs() == expected_inhibit_kwargs
             return (fake_cookie,)
 
-    method = method_cls(dbus_adapter=TestAdapter())
-    assert method.inhibit_cookie is None
+        assert call.method == method_uninhibit
+        assert call.get_kwargs() == expected_uninhibit_kwargs
+
+    return method_cls(dbus_adapter=dbus_adapter_factory(process))
+
+
+@pytest.fixture(scope="session")
+def gnome_method_adapter_returns_none(method_cls, dbus_adapter_factory):
+    """A GNOME Method instance with a dbus adapter which returns None. The
+    enter_mode() fails, so the instance state never changes."""
+
+    return method_cls(dbus_adapter=dbus_adapter_factory(lambda _: None))
+
+
+@pytest.fixture
+def gnome_method(_gnome_method):
+    yield _gnome_method
+    # The same instance is used in multiple tests. Reset the state.
+    _gnome_method.inhibit_cookie = None
+
+
+@pytest.fixture
+def entered_gnome_method(gnome_method, fake_cookie):
+    """The gnome_method in the state it is after a successful enter_mode().
+    The state is set directly, so no D-Bus call is needed for it."""
+    gnome_method.inhibit_cookie = fake_cookie
+    return gnome_method
+
+
+def test_gnome_enter_mode(gnome_method, fake_cookie):
+    assert gnome_method.inhibit_cookie is None
 
     # Act
-    enter_retval = method.enter_mode()
+    enter_retval = gnome_method.enter_mode()
 
     # Assert
     assert enter_retval is None
     # Entering mode sets a inhibit_cookie to value returned by the DBusAdapter
-    assert method.inhibit_cookie == fake_cookie
+    assert gnome_method.inhibit_cookie == fake_cookie
 
 
-@pytest.mark.parametrize(
-    "method_cls",
-    [GnomeSessionManagerNoSuspend, GnomeSessionManagerNoIdle],
-)
-def test_gnome_exit_mode(method_cls):
-    # Arrange
-    method_uninhibit = DBusMethod(
-        name="Uninhibit",
-        signature="u",
-        params=("inhibit_cookie",),
-    ).of(session_manager)
-
-    class TestAdapter(DBusAdapter):
-        def process(self, call):
-            assert call.method == method_uninhibit
-            assert call.get_kwargs() == {"inhibit_cookie": fake_cookie}
-
-    method = method_cls(dbus_adapter=TestAdapter())
-    method.inhibit_cookie = fake_cookie
-
+def test_gnome_exit_mode(entered_gnome_method):
     # Act
-    exit_retval = method.exit_mode()
+    exit_retval = entered_gnome_method.exit_mode()
 
     # Assert
     assert exit_retval is None
     # exiting mode unsets the inhibit_cookie
-    assert method.inhibit_cookie is None
+    assert entered_gnome_method.inhibit_cookie is None
 
 
-@pytest.mark.parametrize(
-    "method_cls",
-    [GnomeSessionManagerNoSuspend, GnomeSessionManagerNoIdle],
-)
-def test_gnome_exit_before_enter(method_cls):
-    method = method_cls(dbus_adapter=DBusAdapter())
-    assert method.inhibit_cookie is None
-    assert method.exit_mode() is None
-
-
-@pytest.mark.parametrize(
-    "method_cls",
-    [GnomeSessionManagerNoSuspend, GnomeSessionManagerNoIdle],
-)
-def test_with_dbus_adapter_which_returns_none(method_cls):
-    class BadAdapterReturnNone(DBusAdapter):
-        def process(self, _):
-            return None
+def test_gnome_exit_before_enter(gnome_method):
+    assert gnome_method.inhibit_cookie is None
+    assert gnome_method.exit_mode() is None
 
-    method = method_cls(dbus_adapter=BadAdapterReturnNone())
 
+def test_with_dbus_adapter_which_returns_none(gnome_method_adapter_returns_none):
     with pytest.raises(
         RuntimeError,
         match=re.escape("Could not get inhibit cookie from org.gnome.SessionManager"),
     ):
-        assert method.enter_mode() is False
+        assert gnome_method_adapter_returns_none.enter_mode() is False
@@ -1,11 +1,18 @@
 from subprocess import PIPE
-from unittest.mock import Mock, call, patch
+from unittest.mock import Mock, call
 
 import pytest
 
 from wakepy.methods import macos
 
 
+@pytest.fixture
+def popen_mock(monkeypatch):
+    popen_mock = Mock()
+    monkeypatch.setattr("wakepy.methods.macos.Popen", popen_mock)
+    return popen_mock
+
+
 @pytest.mark.parametrize(
     "method_cls, expected_command",
     [
@@ -13,18 +20,16 @@ from wakepy.methods import macos
         (macos.CaffeinateKeepPresenting, ["caffeinate", "-d"]),
     ],
 )
-def test_enter_mode_success(method_cls, expected_command):
+def test_enter_mode_success(method_cls, expected_command, popen_mock):
     method = method_cls()
 
-    with patch("wakepy.methods.macos.Popen") as popenmock:
-        popenmock.return_value = Mock()
-        retval = method.enter_mode()
+    retval = method.enter_mode()
 
     assert retval is None
     assert expected_command == method.command.split()
-    popenmock.assert_called_with(expected_command, stdin=PIPE, stdout=PIPE)
+    popen_mock.assert_called_with(expected_command, stdin=PIPE, stdout=PIPE)
     # Entering the mode sets the ._process
-    assert method._process is popenmock.return_value
+    assert method._process is popen_mock.return_value
 
 
 @pytest.mark.parametrize(
@@ -1,178 +1,136 @@
 import re
 import sys
-from unittest.mock import patch
+from unittest.mock import Mock
 
 import pytest
 
 if sys.platform != "win32":
     pytest.skip(allow_module_level=True)
 
-import wakepy.methods.windows as windows  # type: ignore[unreachable, unused-ignore]
-from wakepy.methods.windows import (
+from wakepy.methods.windows import (  # type: ignore[unreachable, unused-ignore]
     ES_CONTINUOUS,
     ES_DISPLAY_REQUIRED,
     ES_SYSTEM_REQUIRED,
     WindowsKeepPresenting,
     WindowsKeepRunning,
+    _get_set_thread_execution_state,
 )
 
-windows._release_event_timeout = 0.001
-"""Make tests *not* to wait forever"""
 
+def _identity(flags):
+    """SetThreadExecutionState replacement for a successful call"""
+    return flags
 
-class TestWindowsSetThreadExecutionState:
 
-    @pytest.mark.parametrize(
-        "method_cls, expected_flag",
-        [
-            (
-                WindowsKeepPresenting,
-                ES_CONTINUOUS | ES_SYSTEM_REQUIRED | ES_DISPLAY_REQUIRED,
-            ),
-            (WindowsKeepRunning, ES_CONTINUOUS | ES_SYSTEM_REQUIRED),
-        ],
-    )
-    def test_enter_mode_success(self, method_cls, expected_flag):
-        method = method_cls()
+def _return_zero(flags):
+    """SetThreadExecutionState replacement for a failed call (NULL)"""
+    return 0
 
-        def set_thread_execution_state(flags):
-            assert flags == expected_flag
-            return flags
 
-        with patch(
-            "wakepy.methods.windows.ctypes.windll.kernel32.SetThreadExecutionState",
-            set_thread_execution_state,
-        ):
-            retval = method.enter_mode()
+def _return_str(flags):
+    """SetThreadExecutionState replacement returning a wrong type"""
+    return "foo"
 
-        assert retval is None
 
-    @pytest.mark.parametrize(
-        "method_cls",
-        [WindowsKeepPresenting, WindowsKeepRunning],
-    )
-    def test_exit_mode_success(self, method_cls):
-        method = method_cls()
-        # prepare: enter the mode
-        with patch(
-            "wakepy.methods.windows.ctypes.windll.kernel32.SetThreadExecutionState",
-            lambda x: x,
-        ):
-            method.enter_mode()
+@pytest.fixture(scope="class")
+def expected_flag(method_cls):
+    return {
+        WindowsKeepPresenting: ES_CONTINUOUS | ES_SYSTEM_REQUIRED | ES_DISPLAY_REQUIRED,
+        WindowsKeepRunning: ES_CONTINUOUS | ES_SYSTEM_REQUIRED,
+    }[method_cls]
 
-        def set_thread_execution_state(flags):
-            assert flags == ES_CONTINUOUS
-            return flags
 
-        with patch(
-            "wakepy.methods.windows.ctypes.windll.kernel32.SetThreadExecutionState",
-            set_thread_execution_state,
-        ):
-            retval = method.exit_mode()
+@pytest.mark.parametrize(
+    "method_cls", [WindowsKeepPresenting, WindowsKeepRunning], scope="class"
+)
+class TestWindowsSetThreadExecutionState:
+
+    @pytest.fixture(autouse=True)
+    def set_thread_execution_state(self, monkeypatch):
+        """The patched SetThreadExecutionState. By default, returns the flags
+        it was called with (success). Tests may change the side_effect."""
+        mock = Mock(side_effect=_identity)
+        monkeypatch.setattr("wakepy.methods.windows._set_thread_execution_state", mock)
+        return mock
+
+    def test_enter_mode_success(
+        self, method_cls, expected_flag, set_thread_execution_state
+    ):
+        method = method_cls()
+
+        retval = method.enter_mode()
 
         assert retval is None
+        set_thread_execution_state.assert_called_once_with(expected_flag)
+
+        # Release the inhibiting thread
+        method.exit_mode()
 
-    @pytest.mark.parametrize(
-        "method_cls",
-        [WindowsKeepPresenting, WindowsKeepRunning],
-    )
-    def test_enter_mode_with_exception(self, method_cls):
+    def test_exit_mode_success(self, method_cls, set_thread_execution_state):
         method = method_cls()
+        # prepare: enter the mode
+        method.enter_mode()
+        set_thread_execution_state.reset_mock()
 
-        def raising_exc(_):
-            raise AttributeError("foo")
+        retval = method.exit_mode()
 
-        with patch(
-            "wakepy.methods.windows.ctypes.windll.kernel32.SetThreadExecutionState",
-            raising_exc,
-        ):
-            with pytest.raises(RuntimeError, match="Could not use kernel32.dll!"):
-                method.enter_mode()
-
-    @pytest.mark.parametrize(
-        "method_cls",
-        [WindowsKeepPresenting, WindowsKeepRunning],
-    )
-    def test_exit_mode_with_exception(self, method_cls):
+        assert retval is None
+        set_thread_execution_state.assert_called_once_with(ES_CONTINUOUS)
+
+    def test_enter_mode_with_exception(self, method_cls, set_thread_execution_state):
         method = method_cls()
 
-        with patch(
-            "wakepy.methods.windows.ctypes.windll.kernel32.SetThreadExecutionState",
-            lambda x: x,
-        ):
+        set_thread_execution_state.side_effect = AttributeError("foo")
+        with pytest.raises(RuntimeError, match="Could not use kernel32.dll!"):
             method.enter_mode()
 
-        def raising_exc(_):
-            raise AttributeError("foo")
+        # The inhibiting thread is released, as exit_mode() is not called.
+        method._inhibiting_thread.join(timeout=1)
+        assert not method._inhibiting_thread.is_alive()
 
-        with patch(
-            "wakepy.methods.windows.ctypes.windll.kernel32.SetThreadExecutionState",
-            raising_exc,
-        ):
-            with pytest.raises(RuntimeError, match="Could not use kernel32.dll!"):
-                method.exit_mode()
-
-    @pytest.mark.parametrize(
-        "method_cls",
-        [WindowsKeepPresenting, WindowsKeepRunning],
-    )
-    def test_exit_mode_with_bad_return_value_from_thread(self, method_cls):
+    def test_exit_mode_with_exception(self, method_cls, set_thread_execution_state):
         method = method_cls()
+        method.enter_mode()
 
-        with patch(
-            "wakepy.methods.windows.ctypes.windll.kernel32.SetThreadExecutionState",
-            lambda x: x,
-        ):
-            method.enter_mode()
+        set_thread_execution_state.side_effect = AttributeError("foo")
+        with pytest.raises(RuntimeError, match="Could not use kernel32.dll!"):
+            method.exit_mode()
+
+    def test_exit_mode_with_bad_return_value_from_thread(
+        self, method_cls, set_thread_execution_state
+    ):
+        method = method_cls()
+        method.enter_mode()
 
         # returning 0 means returning NULL (error in SetThreadExecutionState
         # call)
-        with patch(
-            "wakepy.methods.windows.ctypes.windll.kernel32.SetThreadExecutionState",
-            lambda x: 0,
-        ):
-            with pytest.raises(
-                RuntimeError, match="SetThreadExecutionState returned NULL"
-            ):
-                method.exit_mode()
-
-    @pytest.mark.parametrize(
-        "method_cls",
-        [WindowsKeepPresenting, WindowsKeepRunning],
-    )
+        set_thread_execution_state.side_effect = _return_zero
+        with pytest.raises(RuntimeError, match="SetThreadExecutionState returned NULL"):
+            method.exit_mode()
+
     def test_exit_mode_before_enter(self, method_cls):
         # does not make much practical sense but required for test coverage
         method = method_cls()
-        # need to add something to the queue; otherwise would wait until an
-        # exception
-        method._queue_from_thread.put(1)
         method.exit_mode()
         assert method._inhibiting_thread is None
 
-    @pytest.mark.parametrize(
-        "method_cls, expected_flag",
-        [
-            (
-                WindowsKeepPresenting,
-                ES_CONTINUOUS | ES_SYSTEM_REQUIRED | ES_DISPLAY_REQUIRED,
-            ),
-            (WindowsKeepRunning, ES_CONTINUOUS | ES_SYSTEM_REQUIRED),
-        ],
-    )
     def test_wrong_return_type_from_set_thread_execution_state(
-        self, method_cls, expected_flag
+        self, method_cls, set_thread_execution_state
     ):
         method = method_cls()
 
-        def set_thread_execution_state(flags):
-            return "foo"
-
-        with patch(
-            "wakepy.methods.windows.ctypes.windll.kernel32.SetThreadExecutionState",
-            set_thread_execution_state,
+        set_thread_execution_state.side_effect = _return_str
+        with pytest.raises(
+            RuntimeError,
+            match=re.escape("Unknown result type: <class 'str'> (foo)"),
         ):
-            with pytest.raises(
-                RuntimeError,
-                match=re.escape("Unknown result type: <class 'str'> (foo)"),
-            ):
-                method.enter_mode()
+            method.enter_mode()
+
+
+def test_set_thread_execution_state_is_created_once(monkeypatch):
+    monkeypatch.setattr("wakepy.methods.windows._set_thread_execution_state", None)
+
+    set_thread_execution_state = _get_set_thread_execution_state()
+
+    assert callable(set_thread_execution_state)
+    assert _get_set_thread_execution_state() is set_thread_execution_state
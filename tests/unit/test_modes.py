@@ -1,9 +1,11 @@
 import re
+from functools import lru_cache
+from typing import Pattern
 
 import pytest
 
 from wakepy import ActivationError, ActivationWarning
-from wakepy.core import ActivationResult, DBusAdapter, Method, Mode, ModeName
+from wakepy.core import ActivationResult, Method, Mode, ModeName
 from wakepy.modes import keep
 
 
@@ -21,6 +23,9 @@ from wakepy.modes import keep
             ModeName.KEEP_PRESENTING,
         ),
     ],
+    ids=["keep.running", "keep.presenting"],
+    # Class scope: the methods fixture is created once per parameter set.
+    scope="class",
 )
 class TestKeepRunninAndPresenting:
     """Tests common for keep.running and keep.presenting functions. The
@@ -28,29 +33,31 @@ class TestKeepRunninAndPresenting:
     function"""
 
     @staticmethod
-    @pytest.fixture
-    def methods(name_prefix, mode_name_, monkeypatch, testutils):
-        """This fixture creates three methods, which belong to a given mode."""
+    @pytest.fixture(scope="class")
+    def methods(name_prefix, mode_name_, testutils):
+        """This fixture creates three methods, which belong to a given mode.
+        The method registry is emptied for the duration of the test class."""
 
-        testutils.empty_method_registry(monkeypatch)
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            testutils.empty_method_registry(monkeypatch)
 
-        class MethodA(Method):
-            name = f"{name_prefix}A"
-            mode_name = mode_name_
+            class MethodA(Method):
+                name = f"{name_prefix}A"
+                mode_name = mode_name_
 
-        class MethodB(Method):
-            name = f"{name_prefix}B"
-            mode_name = mode_name_
+            class MethodB(Method):
+                name = f"{name_prefix}B"
+                mode_name = mode_name_
 
-        class MethodC(Method):
-            name = f"{name_prefix}C"
-            mode_name = mode_name_
+            class MethodC(Method):
+                name = f"{name_prefix}C"
+                mode_name = mode_name_
 
-        return dict(
-            MethodA=MethodA,
-            MethodB=MethodB,
-            MethodC=MethodC,
-        )
+            yield dict(
+                MethodA=MethodA,
+                MethodB=MethodB,
+                MethodC=MethodC,
+            )
 
     def test_all_modes_are_selected_automatically(self, function_under_test, methods):
         """Simple test for keep.running and keep.presenting. Tests that all
@@ -88,19 +95,19 @@ class TestKeepRunninAndPresenting:
             methods["MethodC"],
         }
 
-    def test_methods_dbus_adapter_parameter(self, function_under_test, methods):
+    def test_methods_dbus_adapter_parameter(
+        self, function_under_test, methods, fake_dbus_adapter
+    ):
         # Case: Test "dbus_adapter" parameter
-        class MyDBusAdapter(DBusAdapter): ...
-
         mode = function_under_test(
-            dbus_adapter=MyDBusAdapter, methods=[x.name for x in methods.values()]
+            dbus_adapter=fake_dbus_adapter, methods=[x.name for x in methods.values()]
         )
-        assert mode._dbus_adapter_cls == MyDBusAdapter
+        assert mode._dbus_adapter_cls == fake_dbus_adapter
 
 
-def test_keep_running_with_fake_success(monkeypatch, fake_dbus_adapter):
+@pytest.mark.usefixtures("WAKEPY_FAKE_SUCCESS_eq_1")
+def test_keep_running_with_fake_success(fake_dbus_adapter):
     """Simple smoke test for keep.running()"""
-    monkeypatch.setenv("WAKEPY_FAKE_SUCCESS", "1")
     mode = keep.running(dbus_adapter=fake_dbus_adapter)
     assert mode.active is False
 
@@ -113,14 +120,20 @@ def test_keep_running_with_fake_success(monkeypatch, fake_dbus_adapter):
     assert isinstance(m.activation_result, ActivationResult)
 
 
-def test_keep_presenting(monkeypatch, fake_dbus_adapter):
+@pytest.mark.usefixtures("WAKEPY_FAKE_SUCCESS_eq_1")
+def test_keep_presenting(fake_dbus_adapter):
     """Simple smoke test for keep.presenting()"""
-    monkeypatch.setenv("WAKEPY_FAKE_SUCCESS", "1")
     with keep.presenting(dbus_adapter=fake_dbus_adapter) as m:
         assert isinstance(m, Mode)
         assert m.activation_result.success is True
 
 
+@lru_cache(maxsize=None)
+def _activation_error_pattern(mode_name: str) -> Pattern[str]:
+    """The compiled regex pattern for the activation failure message."""
+    return re.compile(re.escape(f'Could not activate Mode "{mode_name}"!'))
+
+
 @pytest.mark.parametrize(
     "mode_under_test, expected_name",
     [
@@ -137,14 +150,16 @@ class TestOnFail:
             self._assertions_for_activation_failure(m, expected_name)
 
     def test_on_fail_warn(self, mode_under_test, expected_name):
-        err_txt = f'Could not activate Mode "{expected_name}"!'
-        with pytest.warns(ActivationWarning, match=re.escape(err_txt)):
+        with pytest.warns(
+            ActivationWarning, match=_activation_error_pattern(expected_name)
+        ):
             with mode_under_test(methods=[], on_fail="warn") as m:
                 self._assertions_for_activation_failure(m, expected_name)
 
     def test_on_fail_error(self, mode_under_test, expected_name):
-        err_txt = f'Could not activate Mode "{expected_name}"!'
-        with pytest.raises(ActivationError, match=re.escape(err_txt)):
+        with pytest.raises(
+            ActivationError, match=_activation_error_pattern(expected_name)
+        ):
             with mode_under_test(methods=[], on_fail="error") as m:
                 self._assertions_for_activation_failure(m, expected_name)
 
@@ -36,8 +36,6 @@ def tox_on_install(tox_env: ToxEnv, arguments: Any, section: str, of_type: str)
     [2]: https://github.com/tox-dev/tox/issues/2729
     """
 
-    print(f"Called tox_on_intall hook ({tox_env.name}, {of_type})")
-
     # (1) The tox_env of .pkg_external is passed here only if the package needs
     # to be built; only if tox is run with at least one environment with
     # skip_install not set to True. This requires the "package = external"
@@ -47,6 +45,7 @@ def tox_on_install(tox_env: ToxEnv, arguments: Any, section: str, of_type: str)
     if (tox_env.name != ".pkg_external") or (of_type != "requires"):
         return
 
+    print(f"Called tox_on_intall hook ({tox_env.name}, {of_type})")
     options = get_options(*sys.argv[1:])
     if options.parsed.skip_build:
         print("Skipping build (--skip-build selected)")